@@ -0,0 +1,106 @@
+"""
+Numba-compiled kernels for N/U Algebra hot loops.
+
+The sequential aggregation and cumulative reduction recurrences are
+tight scalar loops where NU object allocation and tuple unpacking
+dominate.  These kernels run the same arithmetic on plain float64
+arrays under @njit, letting LLVM compile the loops to native code.
+
+This module requires numba; callers import it inside a try/except and
+fall back to the pure-Python implementations when it is unavailable.
+
+Reference:
+Martin, Eric D. (2025). The NASA Paper & Small Falcon Algebra.
+DOI: 10.5281/zenodo.17172694
+"""
+
+import math
+
+import numpy as np
+from numba import njit, prange
+
+NUMBA_AVAILABLE = True
+
+
+@njit(cache=True)
+def _agg_seq(values, errors):
+    """Sequential conservative aggregation over parallel float64 arrays."""
+    result_val = values[0]
+    result_err = errors[0]
+    for i in range(1, len(values)):
+        v2 = values[i]
+        e2 = errors[i]
+        new_val = (result_val + v2) * 0.5
+        result_err = (result_err + e2) * 0.5 + abs(result_val - v2) * 0.5
+        result_val = new_val
+    return result_val, result_err
+
+
+@njit(cache=True, parallel=True)
+def _agg_batch(values, errors):
+    """Sequential aggregation of (B, N) batches, parallel over B."""
+    n_batch, n_meas = values.shape
+    out_val = np.empty(n_batch)
+    out_err = np.empty(n_batch)
+    for b in prange(n_batch):
+        result_val = values[b, 0]
+        result_err = errors[b, 0]
+        for i in range(1, n_meas):
+            v2 = values[b, i]
+            e2 = errors[b, i]
+            new_val = (result_val + v2) * 0.5
+            result_err = (result_err + e2) * 0.5 + abs(result_val - v2) * 0.5
+            result_val = new_val
+        out_val[b] = result_val
+        out_err[b] = result_err
+    return out_val, out_err
+
+
+@njit(cache=True, parallel=True)
+def _tension_kernel(n, u):
+    """
+    Pairwise tensions and overlap flags, streamed over (i, j) pairs.
+
+    Writes directly into flat upper-triangle outputs (row-major pair
+    order, matching np.triu_indices) without materializing the N×N
+    intermediate matrices of the broadcasted version.
+    """
+    n_meas = n.shape[0]
+    n_pairs = n_meas * (n_meas - 1) // 2
+    out_delta = np.empty(n_pairs)
+    out_sigma = np.empty(n_pairs)
+    out_overlap = np.empty(n_pairs, dtype=np.bool_)
+    for i in prange(n_meas):
+        base = i * n_meas - i * (i + 1) // 2
+        for j in range(i + 1, n_meas):
+            idx = base + (j - i - 1)
+            delta = abs(n[i] - n[j])
+            out_delta[idx] = delta
+            out_sigma[idx] = delta / math.hypot(u[i], u[j])
+            out_overlap[idx] = (min(n[i] + u[i], n[j] + u[j]) >=
+                                max(n[i] - u[i], n[j] - u[j]))
+    return out_delta, out_sigma, out_overlap
+
+
+@njit(cache=True)
+def _cum_sum_arr(ns, us):
+    """Cumulative N/U sum: (Σnᵢ, Σuᵢ) over parallel float64 arrays."""
+    n_total = ns[0]
+    u_total = us[0]
+    for i in range(1, len(ns)):
+        n_total += ns[i]
+        u_total += us[i]
+    return n_total, u_total
+
+
+@njit(cache=True)
+def _cum_mul_arr(ns, us):
+    """Cumulative N/U product using the rule u' = |n₁|u₂ + |n₂|u₁."""
+    n_total = ns[0]
+    u_total = us[0]
+    for i in range(1, len(ns)):
+        n2 = ns[i]
+        u2 = us[i]
+        u_total = abs(n_total) * u2 + abs(n2) * u_total
+        n_total = n_total * n2
+    return n_total, u_total
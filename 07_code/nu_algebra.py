@@ -12,6 +12,19 @@ DOI: 10.5281/zenodo.17172694
 from typing import Union
 import math
 
+try:
+    import numpy as np
+except ImportError:  # numpy unavailable — pure-Python fallback
+    np = None
+
+try:
+    import _nu_kernels
+except ImportError:  # numba unavailable — pure-Python fallback
+    _nu_kernels = None
+
+# Below this size the array extraction costs more than the loop saves
+_KERNEL_MIN_SIZE = 32
+
 
 class NU:
     """
@@ -20,7 +33,10 @@ class NU:
     Attributes:
         n (float): Nominal (central) value
         u (float): Uncertainty bound (always non-negative)
-    
+
+    Instances use __slots__ to keep the per-pair footprint small in
+    aggregation loops; arbitrary extra attributes cannot be attached.
+
     Examples:
         >>> voltage = NU(2.00, 0.05)  # 2.00 V ± 0.05 V
         >>> current = NU(1.20, 0.02)  # 1.20 A ± 0.02 A
@@ -28,7 +44,9 @@ class NU:
         >>> print(total)
         NU(3.20, 0.07)
     """
-    
+
+    __slots__ = ('n', 'u')
+
     def __init__(self, n: float, u: float):
         """
         Initialize an N/U pair.
@@ -39,7 +57,21 @@ class NU:
         """
         self.n = float(n)
         self.u = max(0.0, float(u))  # Ensure non-negative
-    
+
+    @classmethod
+    def _unsafe(cls, n: float, u: float) -> 'NU':
+        """
+        Construct an N/U pair without validation.
+
+        Skips the float() casts and non-negativity clamp of __init__.
+        Internal use only: callers must guarantee n and u are floats
+        and u ≥ 0 (true by construction for all algebra operators).
+        """
+        obj = cls.__new__(cls)
+        obj.n = n
+        obj.u = u
+        return obj
+
     def __repr__(self) -> str:
         """String representation for debugging."""
         return f"NU({self.n}, {self.u})"
@@ -70,7 +102,7 @@ class NU:
             >>> NU(10, 1).add(NU(5, 0.5))
             NU(15, 1.5)
         """
-        return NU(self.n + other.n, self.u + other.u)
+        return NU._unsafe(self.n + other.n, self.u + other.u)
     
     def sub(self, other: 'NU') -> 'NU':
         """
@@ -82,7 +114,7 @@ class NU:
             >>> NU(10, 1).sub(NU(5, 0.5))
             NU(5, 1.5)
         """
-        return NU(self.n - other.n, self.u + other.u)
+        return NU._unsafe(self.n - other.n, self.u + other.u)
     
     def mul(self, other: 'NU') -> 'NU':
         """
@@ -101,9 +133,9 @@ class NU:
             >>> NU(4.0, 0.1).mul(NU(3.0, 0.2))
             NU(12.0, 1.1)
         """
-        return NU(
+        return NU._unsafe(
             self.n * other.n,
-            abs(self.n) * other.u + abs(other.n) * self.u
+            math.fabs(self.n) * other.u + math.fabs(other.n) * self.u
         )
     
     def scalar(self, a: float) -> 'NU':
@@ -120,7 +152,7 @@ class NU:
             >>> NU(10, 1).scalar(2.5)
             NU(25.0, 2.5)
         """
-        return NU(a * self.n, abs(a) * self.u)
+        return NU._unsafe(a * self.n, math.fabs(a) * self.u)
     
     def affine(self, a: float, b: float = 0.0) -> 'NU':
         """
@@ -137,7 +169,7 @@ class NU:
             >>> NU(10, 1).affine(2, 5)  # 2x + 5
             NU(25, 2)
         """
-        return NU(a * self.n + b, abs(a) * self.u)
+        return NU._unsafe(a * self.n + b, math.fabs(a) * self.u)
     
     # ==================== Special Operators ====================
     
@@ -155,7 +187,7 @@ class NU:
             >>> NU(5, 2).catch()
             NU(0, 7)
         """
-        return NU(0, abs(self.n) + self.u)
+        return NU._unsafe(0.0, math.fabs(self.n) + self.u)
     
     def flip(self) -> 'NU':
         """
@@ -171,7 +203,7 @@ class NU:
             >>> NU(5, 2).flip()
             NU(2, 5)
         """
-        return NU(self.u, abs(self.n))
+        return NU._unsafe(self.u, math.fabs(self.n))
     
     # ==================== Properties ====================
     
@@ -191,7 +223,7 @@ class NU:
             >>> nu.catch().invariant()
             7.0
         """
-        return abs(self.n) + self.u
+        return math.fabs(self.n) + self.u
     
     def lower_bound(self) -> float:
         """Conservative lower bound: n - u"""
@@ -219,7 +251,7 @@ class NU:
         """
         if self.n == 0:
             return float('inf')
-        return self.u / abs(self.n)
+        return self.u / math.fabs(self.n)
     
     def is_sign_stable(self) -> bool:
         """
@@ -228,7 +260,7 @@ class NU:
         Returns:
             True if the interval [n-u, n+u] doesn't contain zero
         """
-        return abs(self.n) > self.u
+        return math.fabs(self.n) > self.u
     
     # ==================== Convenience Methods ====================
     
@@ -260,28 +292,38 @@ class NU:
     
     def __abs__(self) -> 'NU':
         """Absolute value with uncertainty propagation"""
-        return NU(abs(self.n), self.u)
+        return NU._unsafe(abs(self.n), self.u)
     
     def pow(self, exponent: int) -> 'NU':
         """
-        Integer power via repeated multiplication.
-        
+        Integer power via exponentiation by squaring.
+
+        The N/U product is associative (the uncertainty rule expands to
+        the symmetric form Σᵢ uᵢ ∏ⱼ≠ᵢ |nⱼ|), so squaring gives the same
+        result as repeated multiplication in O(log n) steps.
+
         Args:
             exponent: Integer exponent (must be >= 1)
-        
+
         Returns:
             N/U pair raised to the power
-        
+
         Example:
             >>> NU(3, 0.1).pow(2)
             NU(9, 0.6)
         """
         if exponent < 1:
             raise ValueError("Only positive integer exponents supported")
-        
-        result = self
-        for _ in range(exponent - 1):
-            result = result.mul(self)
+
+        result = NU(1.0, 0.0)
+        base = self
+        e = exponent
+        while e:
+            if e & 1:
+                result = result.mul(base)
+            e >>= 1
+            if e:
+                base = base.mul(base)
         return result
 
 
@@ -303,7 +345,13 @@ def cumulative_sum(*nu_pairs: NU) -> NU:
     """
     if not nu_pairs:
         return NU(0, 0)
-    
+
+    if _nu_kernels is not None and len(nu_pairs) >= _KERNEL_MIN_SIZE:
+        count = len(nu_pairs)
+        ns = np.fromiter((nu.n for nu in nu_pairs), dtype=np.float64, count=count)
+        us = np.fromiter((nu.u for nu in nu_pairs), dtype=np.float64, count=count)
+        return NU(*_nu_kernels._cum_sum_arr(ns, us))
+
     result = nu_pairs[0]
     for nu in nu_pairs[1:]:
         result = result.add(nu)
@@ -326,7 +374,13 @@ def cumulative_product(*nu_pairs: NU) -> NU:
     """
     if not nu_pairs:
         return NU(1, 0)
-    
+
+    if _nu_kernels is not None and len(nu_pairs) >= _KERNEL_MIN_SIZE:
+        count = len(nu_pairs)
+        ns = np.fromiter((nu.n for nu in nu_pairs), dtype=np.float64, count=count)
+        us = np.fromiter((nu.u for nu in nu_pairs), dtype=np.float64, count=count)
+        return NU(*_nu_kernels._cum_mul_arr(ns, us))
+
     result = nu_pairs[0]
     for nu in nu_pairs[1:]:
         result = result.mul(nu)
@@ -361,16 +415,81 @@ def weighted_mean(nu_pairs: list, weights: list = None) -> NU:
     total_weight = sum(weights)
     if total_weight == 0:
         raise ValueError("Total weight cannot be zero")
-    
+
+    if np is not None:
+        # Single NumPy reduction instead of 2N intermediate NU pairs
+        count = len(nu_pairs)
+        ns = np.fromiter((nu.n for nu in nu_pairs), dtype=np.float64, count=count)
+        us = np.fromiter((nu.u for nu in nu_pairs), dtype=np.float64, count=count)
+        w = np.asarray(weights, dtype=np.float64)
+        inv = 1.0 / total_weight
+        return NU._unsafe(float((w * ns).sum() * inv),
+                          float((np.abs(w) * us).sum() * abs(inv)))
+
     # Weighted sum
     weighted_sum = cumulative_sum(*[
         nu.scalar(w) for nu, w in zip(nu_pairs, weights)
     ])
-    
+
     # Normalize by total weight
     return weighted_sum.scalar(1.0 / total_weight)
 
 
+def weighted_mean_arrays(values, uncertainties, weights=None):
+    """
+    Weighted mean over array-valued measurements.
+
+    Generalizes weighted_mean to vector measurements (e.g. per-redshift
+    H₀(z) bins or per-probe systematics decompositions): values and
+    uncertainties are (N,) or (N, bins) arrays with one row per probe.
+    The weighted reduction over the probe axis runs as a single
+    np.einsum contraction, so multiplication and summation fuse into
+    one pass without intermediate scaled copies.
+
+    Args:
+        values: Nominal values, shape (N,) or (N, ...)
+        uncertainties: Uncertainty bounds, same shape as values
+        weights: Optional per-probe weights, shape (N,) (default: equal)
+
+    Returns:
+        Tuple (n, u) with the leading probe axis reduced away —
+        floats for 1-D input, arrays for multi-d input
+
+    Example:
+        >>> weighted_mean_arrays([10, 12, 11], [1, 1.5, 0.8])
+        (11.0, 1.1)
+    """
+    if np is None:
+        raise ImportError("weighted_mean_arrays requires NumPy")
+
+    ns = np.asarray(values, dtype=np.float64)
+    us = np.asarray(uncertainties, dtype=np.float64)
+
+    if ns.shape != us.shape:
+        raise ValueError("Values and uncertainties must have same shape")
+    if ns.shape[0] == 0:
+        raise ValueError("Cannot compute mean of empty array")
+
+    if weights is None:
+        w = np.ones(ns.shape[0])
+    else:
+        w = np.asarray(weights, dtype=np.float64)
+
+    if w.shape != (ns.shape[0],):
+        raise ValueError("Weights must match number of measurements")
+
+    total_weight = w.sum()
+    if total_weight == 0:
+        raise ValueError("Total weight cannot be zero")
+
+    n_mean = np.einsum('i,i...->...', w, ns) / total_weight
+    u_mean = np.einsum('i,i...->...', np.abs(w), us) / abs(total_weight)
+
+    if ns.ndim == 1:
+        return float(n_mean), float(u_mean)
+    return n_mean, u_mean
+
+
 # ==================== Compatibility Aliases ====================
 
 def NU_add(x: NU, y: NU) -> NU: